@@ -1,8 +1,13 @@
-from preswald import connect, get_df, query, table, text, plotly
+import glob
+import os
+import tempfile
+
+from preswald import connect, get_df, table, text, plotly
 import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 
 
@@ -12,14 +17,74 @@ from plotly.subplots import make_subplots
 connect()
 raw_ems_data = get_df("nycems.csv")
 
-# BACKUP THE ORIGINAL DATASET FOR SAFETY
-original_dataset = raw_ems_data.copy()
-working_dataset = raw_ems_data.copy()
+# CACHE BUILT FIGURES ON DISK SO RERUNS REUSE THEM UNTIL THE CSV OR THIS SCRIPT CHANGES
+FIGURE_CACHE_DIR = ".figure_cache"
+try:
+    figure_cache_key = "-".join(str(os.stat(path).st_mtime_ns)
+                                for path in ["nycems.csv", globals().get("__file__", "ems_analytics.py")])
+except OSError:
+    figure_cache_key = None
+
+
+def cached_figure(figure_id, build_figure):
+    if figure_cache_key is None:
+        return build_figure()
+
+    cache_path = os.path.join(FIGURE_CACHE_DIR, f"{figure_id}-{figure_cache_key}.json")
+    try:
+        return pio.read_json(cache_path)
+    except (ValueError, OSError):
+        pass
+
+    figure = build_figure()
+    try:
+        os.makedirs(FIGURE_CACHE_DIR, exist_ok=True)
+        for stale_path in glob.glob(os.path.join(FIGURE_CACHE_DIR, f"{figure_id}-*.json")):
+            try:
+                os.remove(stale_path)
+            except FileNotFoundError:
+                pass
+
+        # WRITE TO A TEMP FILE AND SWAP IT IN SO CONCURRENT RERUNS NEVER READ A HALF WRITTEN ENTRY
+        temp_fd, temp_path = tempfile.mkstemp(dir=FIGURE_CACHE_DIR, prefix=f"{figure_id}-", suffix=".tmp")
+        try:
+            with os.fdopen(temp_fd, "w") as temp_file:
+                temp_file.write(pio.to_json(figure))
+            os.replace(temp_path, cache_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+    except (ValueError, OSError):
+        pass
+    return figure
+
+# KEEP ONLY THE COLUMNS THE DASHBOARD READS; THIS PROJECTION IS THE ONLY COPY OF THE RAW DATA
+date_columns = [col for col in raw_ems_data.columns if 'date' in col.lower() or 'time' in col.lower()]
+analysis_columns = ['borough', 'dispatch_response_seconds_qy', 'incident_response_seconds_qy', 'final_call_type'] + date_columns[:1]
+clean_dataset = raw_ems_data[analysis_columns].copy()
+
+# PARSE THE TREND DATE COLUMN ONCE WITH AN EXPLICIT FORMAT SO PANDAS SKIPS FORMAT INFERENCE
+if date_columns:
+    clean_dataset[date_columns[0]] = pd.to_datetime(clean_dataset[date_columns[0]],
+                                                    format='%Y-%m-%dT%H:%M:%S.%f',
+                                                    errors='coerce',
+                                                    cache=True)
+
+# CONVERT STRING RESPONSE TIMES TO NUMERIC VALUES AND DROP UNUSABLE ROWS IN PLACE
+response_columns = ['incident_response_seconds_qy', 'dispatch_response_seconds_qy']
+clean_dataset[response_columns] = (clean_dataset[response_columns]
+                                   .apply(pd.to_numeric, errors='coerce', downcast='float')
+                                   .astype('float32'))
+clean_dataset.dropna(subset=['dispatch_response_seconds_qy', 'borough'], inplace=True)
+
+# STORE BOROUGH AS A CATEGORY SO EVERY GROUPING USES INTEGER CODES
+clean_dataset['borough'] = clean_dataset['borough'].astype('category')
 
-# CONVERT STRING RESPONSE TIMES TO NUMERIC VALUES FOR CALCULATIONS
-working_dataset['incident_response_seconds_qy'] = pd.to_numeric(working_dataset['incident_response_seconds_qy'], errors='coerce')
-working_dataset['dispatch_response_seconds_qy'] = pd.to_numeric(working_dataset['dispatch_response_seconds_qy'], errors='coerce') 
-clean_dataset = working_dataset.dropna(subset=['dispatch_response_seconds_qy', 'borough']).copy()
+# MATERIALISE THE DISPATCH COLUMN ONCE AND PRECOMPUTE THE THRESHOLD MASKS SHARED BY SEVERAL METRICS
+dispatch_values = clean_dataset['dispatch_response_seconds_qy'].to_numpy(copy=False)
+within_5min = dispatch_values <= 300
+within_8min = dispatch_values <= 480
+over_10min = dispatch_values > 600
 
 
 
@@ -29,54 +94,52 @@ clean_dataset = working_dataset.dropna(subset=['dispatch_response_seconds_qy', '
 text("# NYC EMS RESPONSE TIME ANALYSIS")
 text("*Comprehensive performance dashboard for emergency medical services*")
 
-# QUERY TO GET FAST EMERGENCY RESPONSES UNDER 5 MINUTES
-fast_query = "SELECT * FROM nycems WHERE dispatch_response_seconds_qy <= 300"
-speedy_calls = query(fast_query, "nycems")
-
-# QUERY TO CHECK VOLUME OF CALLS BY BOROUGH WITH MINIMUM THRESHOLD
-vol_query = "SELECT borough, COUNT(*) as call_volume FROM nycems GROUP BY borough HAVING COUNT(*) > 1000 ORDER BY call_volume DESC"
-borough_volumes = query(vol_query, "nycems")
-
-# QUERY TO IDENTIFY DELAYED RESPONSES OVER 8 MINUTES
-slow_query = "SELECT * FROM nycems WHERE dispatch_response_seconds_qy > 480"
-delayed_calls = query(slow_query, "nycems")
-
-# CALCULATE COMPREHENSIVE STATISTICS FOR EACH BOROUGH
-borough_stats = (clean_dataset.groupby('borough')
-                .agg({
-                    'dispatch_response_seconds_qy': ['mean', 'median', 'std', 'count'],
-                    'incident_response_seconds_qy': ['mean', 'median']
-                })
-                .round(2))
-
-borough_stats.columns = ['avg_dispatch_sec', 'median_dispatch_sec', 'std_dispatch', 'total_calls', 'avg_incident_sec', 'median_incident']
-borough_stats = borough_stats.reset_index()
-
-# CALCULATE PERFORMANCE COMPLIANCE RATES FOR INDUSTRY BENCHMARKS
-performance_metrics = (clean_dataset.groupby('borough')
-                      .apply(lambda x: pd.Series({
-                          'meets_5min': (x['dispatch_response_seconds_qy'] <= 300).mean() * 100,
-                          'meets_8min': (x['dispatch_response_seconds_qy'] <= 480).mean() * 100,
-                          'extreme_delays': (x['dispatch_response_seconds_qy'] > 600).sum()
-                      }), include_groups=False)
-                      .round(2)
-                      .reset_index())
-
-master_data = borough_stats.merge(performance_metrics, on='borough')
+# FLAG INDUSTRY BENCHMARK THRESHOLDS ONCE SO EVERY METRIC AGGREGATES IN A SINGLE PASS
+clean_dataset['le300'] = within_5min.astype('int8')
+clean_dataset['le480'] = within_8min.astype('int8')
+clean_dataset['gt600'] = over_10min.astype('int8')
+
+# CALCULATE COMPREHENSIVE STATISTICS AND COMPLIANCE RATES FOR EACH BOROUGH
+master_data = (clean_dataset.groupby('borough', observed=True)
+              .agg(avg_dispatch_sec=('dispatch_response_seconds_qy', 'mean'),
+                   median_dispatch_sec=('dispatch_response_seconds_qy', 'median'),
+                   std_dispatch=('dispatch_response_seconds_qy', 'std'),
+                   total_calls=('dispatch_response_seconds_qy', 'size'),
+                   avg_incident_sec=('incident_response_seconds_qy', 'mean'),
+                   median_incident=('incident_response_seconds_qy', 'median'),
+                   meets_5min=('le300', 'mean'),
+                   meets_8min=('le480', 'mean'),
+                   extreme_delays=('gt600', 'sum')))
+master_data[['meets_5min', 'meets_8min']] *= 100
+# WIDEN THE FLOAT32 AGGREGATES BEFORE ROUNDING SO TABLES SHOW CLEAN TWO DECIMAL VALUES
+master_data = master_data.astype({col: 'float64' for col in master_data.select_dtypes('float32').columns})
+master_data = master_data.round(2).reset_index()
+
+# FAST EMERGENCY RESPONSES UNDER 5 MINUTES TAKEN FROM THE CLEANED DATA INSTEAD OF A SECOND TABLE SCAN
+# WIDEN THE FLOAT32 SECONDS BACK TO WHOLE NUMBERS SO THE EXAMPLES TABLE SHOWS CLEAN VALUES
+speedy_calls = (clean_dataset.loc[within_5min, ['borough', 'final_call_type', 'dispatch_response_seconds_qy']]
+               .head(12)
+               .astype({'dispatch_response_seconds_qy': 'int64'}))
+
+# CALL VOLUME BY BOROUGH WITH MINIMUM THRESHOLD DERIVED FROM THE BOROUGH AGGREGATES
+borough_volumes = (master_data.loc[master_data['total_calls'] > 1000, ['borough', 'total_calls']]
+                  .rename(columns={'total_calls': 'call_volume'})
+                  .sort_values('call_volume', ascending=False)
+                  .reset_index(drop=True))
 
 # CREATE PERFORMANCE CATEGORIES FOR RESPONSE TIME ANALYSIS
-clean_dataset['perf_bucket'] = pd.cut(clean_dataset['dispatch_response_seconds_qy'], 
-                                     bins=[0, 300, 480, 600, np.inf], 
-                                     labels=['Excellent (<5min)', 'Good (5-8min)', 'Poor (8-10min)', 'Critical (>10min)'])
+perf_labels = ['Excellent (<5min)', 'Good (5-8min)', 'Poor (8-10min)', 'Critical (>10min)']
+perf_codes = np.searchsorted(np.array([300, 480, 600], dtype=dispatch_values.dtype), dispatch_values, side='left').astype('int8')
+clean_dataset['perf_bucket'] = pd.Categorical.from_codes(perf_codes, perf_labels)
 
-bucket_counts = clean_dataset['perf_bucket'].value_counts().reset_index()
-bucket_counts.columns = ['perf_bucket', 'incidents']
+bucket_counts = pd.DataFrame({'perf_bucket': perf_labels,
+                              'incidents': np.bincount(perf_codes, minlength=len(perf_labels))})
 
 # CALCULATE CITYWIDE SYSTEM PERFORMANCE METRICS
 total_calls = len(clean_dataset)
-system_avg_min = clean_dataset['dispatch_response_seconds_qy'].mean() / 60
-overall_8min_rate = (clean_dataset['dispatch_response_seconds_qy'] <= 480).mean() * 100
-extreme_delays = (clean_dataset['dispatch_response_seconds_qy'] > 600).sum()
+system_avg_min = dispatch_values.mean(dtype='float64') / 60
+overall_8min_rate = within_8min.mean() * 100
+extreme_delays = int(over_10min.sum())
 
 # CREATE EXECUTIVE SUMMARY DASHBOARD
 kpi_summary = pd.DataFrame([
@@ -87,15 +150,18 @@ kpi_summary = pd.DataFrame([
     ['System Status', 'Below Target' if overall_8min_rate < 90 else 'Meeting Standards']
 ], columns=['Metric', 'Value'])
 
-best_borough = master_data.loc[master_data['meets_8min'].idxmax()]
-worst_borough = master_data.loc[master_data['meets_8min'].idxmin()]
-busiest_borough = master_data.loc[master_data['total_calls'].idxmax()]
+# LOCATE TOP, BOTTOM AND BUSIEST BOROUGHS BY POSITION ON THE RAW ARRAYS
+meets_8min = master_data['meets_8min'].to_numpy()
+call_totals = master_data['total_calls'].to_numpy()
+best_borough = master_data.iloc[int(np.argmax(meets_8min))]
+worst_borough = master_data.iloc[int(np.argmin(meets_8min))]
+busiest_borough = master_data.iloc[int(np.argmax(call_totals))]
 
 key_insights = pd.DataFrame([
     ['Top Performer', f"{best_borough['borough']} ({best_borough['meets_8min']:.1f}% compliance)"],
     ['Improvement Needed', f"{worst_borough['borough']} ({worst_borough['meets_8min']:.1f}% compliance)"],
     ['Highest Volume', f"{busiest_borough['borough']} ({busiest_borough['total_calls']:,} calls)"],
-    ['Boroughs Under 80%', f"{(master_data['meets_8min'] < 80).sum()} require attention"],
+    ['Boroughs Under 80%', f"{(meets_8min < 80).sum()} require attention"],
     ['Recommendation', 'Resource reallocation needed' if overall_8min_rate < 85 else 'Maintain current operations']
 ], columns=['Category', 'Finding'])
 
@@ -108,22 +174,26 @@ text("## EXECUTIVE OVERVIEW")
 table(kpi_summary)
 
 # CREATE BOROUGH COMPLIANCE CHART WITH PROPER AXIS LABELS
-sorted_data = master_data.sort_values('meets_8min', ascending=False)
-fig_main = px.bar(sorted_data,
-                 x='borough', 
-                 y='meets_8min',
-                 color='meets_8min',
-                 title='Borough Performance: 8-Minute Response Target',
-                 labels={'meets_8min': 'Compliance Rate (%)', 'borough': 'NYC Borough'},
-                 color_continuous_scale='RdYlGn',
-                 text='meets_8min')
-
-fig_main.add_hline(y=90, line_dash="dash", line_color="red", line_width=3, 
-                  annotation_text="Target: 90%")
-fig_main.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
-fig_main.update_layout(height=450, showlegend=False)
-fig_main.update_xaxes(title_text="NYC Borough")
-fig_main.update_yaxes(title_text="8-Minute Compliance Rate (%)")
+def build_fig_main():
+    sorted_data = master_data.sort_values('meets_8min', ascending=False)
+    fig_main = px.bar(sorted_data,
+                     x='borough', 
+                     y='meets_8min',
+                     color='meets_8min',
+                     title='Borough Performance: 8-Minute Response Target',
+                     labels={'meets_8min': 'Compliance Rate (%)', 'borough': 'NYC Borough'},
+                     color_continuous_scale='RdYlGn',
+                     text='meets_8min')
+
+    fig_main.add_hline(y=90, line_dash="dash", line_color="red", line_width=3, 
+                      annotation_text="Target: 90%")
+    fig_main.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
+    fig_main.update_layout(height=450, showlegend=False)
+    fig_main.update_xaxes(title_text="NYC Borough")
+    fig_main.update_yaxes(title_text="8-Minute Compliance Rate (%)")
+    return fig_main
+
+fig_main = cached_figure('fig_main', build_fig_main)
 plotly(fig_main)
 
 table(key_insights)
@@ -137,42 +207,55 @@ text("## DETAILED BOROUGH METRICS")
 table(master_data.sort_values('meets_8min', ascending=False))
 
 # RESPONSE TIME DISTRIBUTION ANALYSIS WITH CLEAR AXES
-clean_times = clean_dataset[clean_dataset['dispatch_response_seconds_qy'] <= 1800]
-response_minutes = clean_times['dispatch_response_seconds_qy'] / 60
-
-fig_dist = px.histogram(x=response_minutes,
-                       nbins=40,
-                       title='NYC EMS Response Time Distribution (Filtered)', 
-                       labels={'x': 'Response Time (Minutes)', 'y': 'Number of Emergency Calls'},
-                       color_discrete_sequence=['#2E86AB'])
-
-fig_dist.add_vline(x=5, line_dash="dot", line_color="green", line_width=2, 
-                  annotation_text="5min")
-fig_dist.add_vline(x=8, line_dash="dash", line_color="orange", line_width=2, 
-                  annotation_text="8min") 
-fig_dist.add_vline(x=10, line_dash="solid", line_color="red", line_width=2, 
-                  annotation_text="10min")
-fig_dist.update_layout(height=450, bargap=0.05, xaxis_range=[0, 25])
-fig_dist.update_xaxes(title_text="Response Time (Minutes)")
-fig_dist.update_yaxes(title_text="Number of Emergency Calls")
+def build_fig_dist():
+    # BIN ONCE IN NUMPY SO ONLY 40 BAR HEIGHTS ARE SENT TO THE BROWSER; THE RANGE DROPS CALLS OVER 25 MINUTES
+    bin_counts, bin_edges = np.histogram(dispatch_values / 60, bins=40, range=(0, 25))
+    fig_dist = go.Figure(go.Bar(x=(bin_edges[:-1] + bin_edges[1:]) / 2,
+                                y=bin_counts,
+                                marker_color='#2E86AB',
+                                hovertemplate='Response Time (Minutes)=%{x:.1f}<br>Number of Emergency Calls=%{y:,}<extra></extra>'))
+    fig_dist.update_layout(title='NYC EMS Response Time Distribution (Filtered)')
+
+    fig_dist.add_vline(x=5, line_dash="dot", line_color="green", line_width=2, 
+                      annotation_text="5min")
+    fig_dist.add_vline(x=8, line_dash="dash", line_color="orange", line_width=2, 
+                      annotation_text="8min") 
+    fig_dist.add_vline(x=10, line_dash="solid", line_color="red", line_width=2, 
+                      annotation_text="10min")
+    fig_dist.update_layout(height=450, bargap=0.05, xaxis_range=[0, 25])
+    fig_dist.update_xaxes(title_text="Response Time (Minutes)")
+    fig_dist.update_yaxes(title_text="Number of Emergency Calls")
+    return fig_dist
+
+fig_dist = cached_figure('fig_dist', build_fig_dist)
 plotly(fig_dist)
 
 # CALL VOLUME VS PERFORMANCE CORRELATION ANALYSIS
-fig_scatter = px.scatter(master_data,
-                        x='total_calls',
-                        y='meets_8min', 
-                        size='avg_dispatch_sec',
-                        color='borough',
-                        title='Call Volume vs Performance Analysis',
-                        labels={'total_calls': 'Total Emergency Calls', 'meets_8min': '8-Min Compliance (%)'},
-                        size_max=25,
-                        hover_data=['avg_dispatch_sec'])
-
-fig_scatter.add_hline(y=90, line_dash="dash", line_color="#d62728", line_width=2)
-fig_scatter.add_hline(y=80, line_dash="dot", line_color="#ff7f0e", line_width=2)
-fig_scatter.update_layout(height=450)
-fig_scatter.update_xaxes(title_text="Total Emergency Calls")
-fig_scatter.update_yaxes(title_text="8-Minute Compliance Rate (%)")
+def build_fig_scatter():
+    # CONVERT THE SMALL BOROUGH TABLE TO PLAIN LISTS ONCE AND DRAW ONE TRACE PER BOROUGH
+    scatter_columns = master_data[['borough', 'total_calls', 'meets_8min', 'avg_dispatch_sec']].to_dict('list')
+    marker_sizeref = max(scatter_columns['avg_dispatch_sec']) / 25 ** 2
+    fig_scatter = go.Figure([go.Scatter(x=[total],
+                                        y=[compliance],
+                                        mode='markers',
+                                        name=borough_name,
+                                        customdata=[[avg_sec]],
+                                        marker=dict(size=[avg_sec], sizemode='area', sizeref=marker_sizeref),
+                                        hovertemplate=('borough=' + borough_name
+                                                       + '<br>Total Emergency Calls=%{x}'
+                                                       + '<br>8-Min Compliance (%)=%{y}'
+                                                       + '<br>avg_dispatch_sec=%{customdata[0]}<extra></extra>'))
+                             for borough_name, total, compliance, avg_sec in zip(*scatter_columns.values())])
+    fig_scatter.update_layout(title='Call Volume vs Performance Analysis', legend_title_text='borough')
+
+    fig_scatter.add_hline(y=90, line_dash="dash", line_color="#d62728", line_width=2)
+    fig_scatter.add_hline(y=80, line_dash="dot", line_color="#ff7f0e", line_width=2)
+    fig_scatter.update_layout(height=450)
+    fig_scatter.update_xaxes(title_text="Total Emergency Calls")
+    fig_scatter.update_yaxes(title_text="8-Minute Compliance Rate (%)")
+    return fig_scatter
+
+fig_scatter = cached_figure('fig_scatter', build_fig_scatter)
 plotly(fig_scatter)
 
 
@@ -182,51 +265,82 @@ plotly(fig_scatter)
 # SIDE BY SIDE COMPARISON OF ALL BOROUGHS WITH KEY METRICS
 text("## COMPARATIVE ANALYSIS BY BOROUGH")
 
-comparison_metrics = master_data[['borough', 'avg_dispatch_sec', 'meets_5min', 'meets_8min', 'total_calls', 'extreme_delays']]
-comparison_metrics['avg_minutes'] = (comparison_metrics['avg_dispatch_sec'] / 60).round(1)
-comparison_metrics = comparison_metrics.drop('avg_dispatch_sec', axis=1)
-table(comparison_metrics.sort_values('meets_8min', ascending=False))
+comparison_metrics = (master_data
+                      .assign(avg_minutes=(master_data['avg_dispatch_sec'] / 60).round(1))
+                      [['borough', 'meets_5min', 'meets_8min', 'total_calls', 'extreme_delays', 'avg_minutes']]
+                      .sort_values('meets_8min', ascending=False))
+table(comparison_metrics)
 
 # STACKED BAR CHART SHOWING PERFORMANCE DISTRIBUTION
-perf_by_borough = pd.crosstab(clean_dataset['borough'], clean_dataset['perf_bucket'], normalize='index') * 100
-perf_by_borough = perf_by_borough.round(1).reset_index()
-
-fig_stacked = px.bar(perf_by_borough.melt(id_vars=['borough'], var_name='perf_bucket', value_name='percentage'),
-                    x='borough',
-                    y='percentage',
-                    color='perf_bucket', 
-                    title='Performance Distribution Across Boroughs',
-                    labels={'percentage': 'Percentage of Calls (%)', 'borough': 'NYC Borough'},
-                    color_discrete_map={
-                        'Excellent (<5min)': '#2ca02c',
-                        'Good (5-8min)': '#1f77b4', 
-                        'Poor (8-10min)': '#ff7f0e',
-                        'Critical (>10min)': '#d62728'
-                    })
-fig_stacked.update_layout(height=450, barmode='stack')
-fig_stacked.update_xaxes(title_text="NYC Borough")
-fig_stacked.update_yaxes(title_text="Percentage of Emergency Calls (%)")
+def build_fig_stacked():
+    bucket_by_borough = clean_dataset.groupby(['borough', 'perf_bucket'], observed=True).size().unstack(fill_value=0)
+    perf_by_borough = (bucket_by_borough.div(bucket_by_borough.sum(axis=1), axis=0) * 100).round(1)
+    perf_long = perf_by_borough.reset_index().melt(id_vars='borough', var_name='perf_bucket', value_name='percentage')
+
+    fig_stacked = px.bar(perf_long,
+                        x='borough',
+                        y='percentage',
+                        color='perf_bucket', 
+                        title='Performance Distribution Across Boroughs',
+                        labels={'percentage': 'Percentage of Calls (%)', 'borough': 'NYC Borough'},
+                        color_discrete_map={
+                            'Excellent (<5min)': '#2ca02c',
+                            'Good (5-8min)': '#1f77b4', 
+                            'Poor (8-10min)': '#ff7f0e',
+                            'Critical (>10min)': '#d62728'
+                        })
+    fig_stacked.update_layout(height=450, barmode='stack')
+    fig_stacked.update_xaxes(title_text="NYC Borough")
+    fig_stacked.update_yaxes(title_text="Percentage of Emergency Calls (%)")
+    return fig_stacked
+
+fig_stacked = cached_figure('fig_stacked', build_fig_stacked)
 plotly(fig_stacked)
 
 # BOX PLOT FOR RESPONSE TIME VARIABILITY ANALYSIS
-filtered_for_box = clean_dataset[clean_dataset['dispatch_response_seconds_qy'] <= 1200].copy()
-
-fig_variability = px.box(filtered_for_box,
-                        x='borough',
-                        y='dispatch_response_seconds_qy',
-                        title='Response Time Consistency by Borough (Outliers Removed)',
-                        labels={'dispatch_response_seconds_qy': 'Response Time (Seconds)', 'borough': 'NYC Borough'},
-                        color='borough')
-
-fig_variability.add_hline(y=300, line_dash="dot", line_color="green", line_width=2, 
-                         annotation_text="5min", annotation_position="left")
-fig_variability.add_hline(y=480, line_dash="dash", line_color="orange", line_width=2,
-                         annotation_text="8min", annotation_position="left")
-fig_variability.add_hline(y=600, line_dash="solid", line_color="red", line_width=2,
-                         annotation_text="10min", annotation_position="left")
-fig_variability.update_layout(height=450, showlegend=False,
-                              xaxis_title="NYC Borough",
-                              yaxis_title="Response Time (Seconds)")
+def build_fig_variability():
+    # SUMMARISE EACH BOROUGH SERVER SIDE SO ONLY THE BOX STATISTICS ARE SENT TO THE BROWSER
+    within_20min = dispatch_values <= 1200
+    box_source = clean_dataset.loc[within_20min, ['borough', 'dispatch_response_seconds_qy']]
+    box_stats = (box_source.groupby('borough', observed=True)['dispatch_response_seconds_qy']
+                .describe(percentiles=[0.25, 0.5, 0.75]))
+
+    # END EACH WHISKER AT THE MOST EXTREME OBSERVED VALUE INSIDE 1.5 X IQR, AS PX.BOX DID
+    box_iqr = box_stats['75%'] - box_stats['25%']
+    box_categories = box_source['borough'].cat.categories
+    lower_limits = (box_stats['25%'] - 1.5 * box_iqr).reindex(box_categories).to_numpy()
+    upper_limits = (box_stats['75%'] + 1.5 * box_iqr).reindex(box_categories).to_numpy()
+    source_codes = box_source['borough'].cat.codes.to_numpy()
+    source_values = box_source['dispatch_response_seconds_qy'].to_numpy()
+    inside_fences = (source_values >= lower_limits[source_codes]) & (source_values <= upper_limits[source_codes])
+    whisker_ends = (box_source.loc[inside_fences]
+                   .groupby('borough', observed=True)['dispatch_response_seconds_qy']
+                   .agg(['min', 'max']))
+    box_stats['lowerfence'] = whisker_ends['min']
+    box_stats['upperfence'] = whisker_ends['max']
+
+    fig_variability = go.Figure([go.Box(name=borough_name,
+                                        x=[borough_name],
+                                        q1=[stats['25%']],
+                                        median=[stats['50%']],
+                                        q3=[stats['75%']],
+                                        lowerfence=[stats['lowerfence']],
+                                        upperfence=[stats['upperfence']])
+                                 for borough_name, stats in box_stats.iterrows()])
+    fig_variability.update_layout(title='Response Time Consistency by Borough (Outliers Removed)')
+
+    fig_variability.add_hline(y=300, line_dash="dot", line_color="green", line_width=2, 
+                             annotation_text="5min", annotation_position="left")
+    fig_variability.add_hline(y=480, line_dash="dash", line_color="orange", line_width=2,
+                             annotation_text="8min", annotation_position="left")
+    fig_variability.add_hline(y=600, line_dash="solid", line_color="red", line_width=2,
+                             annotation_text="10min", annotation_position="left")
+    fig_variability.update_layout(height=450, showlegend=False,
+                                  xaxis_title="NYC Borough",
+                                  yaxis_title="Response Time (Seconds)")
+    return fig_variability
+
+fig_variability = cached_figure('fig_variability', build_fig_variability)
 plotly(fig_variability)
 
 
@@ -236,89 +350,109 @@ plotly(fig_variability)
 # PERCENTILE ANALYSIS FOR DEEPER UNDERSTANDING OF PERFORMANCE
 text("## ADVANCED PERFORMANCE INSIGHTS")
 
-percentile_data = clean_dataset.groupby('borough')['dispatch_response_seconds_qy'].quantile([0.25, 0.5, 0.75, 0.9, 0.95]).unstack()
-percentile_data.columns = ['p25', 'p50_median', 'p75', 'p90', 'p95'] 
-percentile_data = percentile_data.reset_index()
-percentile_minutes = percentile_data.copy()
-for col in ['p25', 'p50_median', 'p75', 'p90', 'p95']:
-    percentile_minutes[col] = (percentile_minutes[col] / 60).round(1)
+# STABLE SORT ON BOROUGH CODES ALONE SO EACH BOROUGH IS ONE CONTIGUOUS SLICE FOR NP.QUANTILE
+percentile_levels = [0.25, 0.5, 0.75, 0.9, 0.95]
+percentile_columns = ['p25', 'p50_median', 'p75', 'p90', 'p95']
+borough_codes = clean_dataset['borough'].cat.codes.to_numpy()
+percentile_order = np.argsort(borough_codes, kind='stable')
+sorted_dispatch = dispatch_values[percentile_order]
+group_codes, group_starts = np.unique(borough_codes[percentile_order], return_index=True)
+group_bounds = np.append(group_starts, len(sorted_dispatch))
+
+percentile_values = np.vstack([np.quantile(sorted_dispatch[start:end], percentile_levels)
+                               for start, end in zip(group_bounds[:-1], group_bounds[1:])])
+percentile_minutes = pd.DataFrame((percentile_values / 60).round(1), columns=percentile_columns)
+percentile_minutes.insert(0, 'borough', clean_dataset['borough'].cat.categories[group_codes])
 
 table(percentile_minutes)
 
 # MULTI DIMENSIONAL RADAR CHART FOR COMPREHENSIVE COMPARISON
-fig_radar = go.Figure()
-
-radar_colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
-for idx, borough_name in enumerate(master_data['borough']):
-    borough_row = master_data[master_data['borough'] == borough_name].iloc[0]
-    
-    speed_score = 100 - ((borough_row['avg_dispatch_sec'] - master_data['avg_dispatch_sec'].min()) / 
-                        (master_data['avg_dispatch_sec'].max() - master_data['avg_dispatch_sec'].min()) * 100)
-    
-    reliability_score = 100 - (borough_row['extreme_delays'] / master_data['extreme_delays'].max() * 100) if master_data['extreme_delays'].max() > 0 else 100
-    
-    fig_radar.add_trace(go.Scatterpolar(
-        r=[borough_row['meets_8min'], 
-           speed_score,
-           borough_row['meets_5min'],
-           reliability_score],
-        theta=['8-Min Compliance', 'Response Speed', '5-Min Excellence', 'Reliability Score'],
-        fill='toself',
-        name=borough_name,
-        line_color=radar_colors[idx % len(radar_colors)]
-    ))
-
-fig_radar.update_layout(
-    polar=dict(radialaxis=dict(visible=True, range=[0, 100], title="Performance Score")),
-    title="Borough Performance Radar Comparison",
-    height=550
-)
+def build_fig_radar():
+    fig_radar = go.Figure()
+
+    radar_colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
+    radar_boroughs = master_data['borough'].to_numpy()
+    avg_dispatch = master_data['avg_dispatch_sec'].to_numpy()
+    extreme_counts = master_data['extreme_delays'].to_numpy()
+    meets_5min = master_data['meets_5min'].to_numpy()
+
+    # SCORE EVERY BOROUGH AT ONCE INSTEAD OF RESCANNING MASTER DATA PER BOROUGH
+    speed_scores = 100 - ((avg_dispatch - avg_dispatch.min()) / np.ptp(avg_dispatch) * 100)
+    reliability_scores = 100 - (extreme_counts / extreme_counts.max() * 100) if extreme_counts.max() > 0 else np.full(len(extreme_counts), 100.0)
+
+    for idx, borough_name in enumerate(radar_boroughs):
+        fig_radar.add_trace(go.Scatterpolar(
+            r=[meets_8min[idx], 
+               speed_scores[idx],
+               meets_5min[idx],
+               reliability_scores[idx]],
+            theta=['8-Min Compliance', 'Response Speed', '5-Min Excellence', 'Reliability Score'],
+            fill='toself',
+            name=borough_name,
+            line_color=radar_colors[idx % len(radar_colors)]
+        ))
+
+    fig_radar.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 100], title="Performance Score")),
+        title="Borough Performance Radar Comparison",
+        height=550
+    )
+    return fig_radar
+
+fig_radar = cached_figure('fig_radar', build_fig_radar)
 plotly(fig_radar)
 
 # CORRELATION MATRIX FOR IDENTIFYING RELATIONSHIPS BETWEEN METRICS
-corr_matrix = master_data[['avg_dispatch_sec', 'total_calls', 'meets_5min', 'meets_8min', 'extreme_delays']].corr()
-fig_corr = px.imshow(corr_matrix,
-                    text_auto=True,
-                    aspect="auto", 
-                    title="Performance Metrics Correlation Analysis",
-                    color_continuous_scale='RdBu_r',
-                    zmin=-1, zmax=1,
-                    labels=dict(x="Performance Metrics", y="Performance Metrics", color="Correlation"))
-fig_corr.update_layout(height=450,
-                       xaxis_title="Performance Metrics",
-                       yaxis_title="Performance Metrics")
+def build_fig_corr():
+    corr_matrix = master_data[['avg_dispatch_sec', 'total_calls', 'meets_5min', 'meets_8min', 'extreme_delays']].corr()
+    fig_corr = px.imshow(corr_matrix,
+                        text_auto=True,
+                        aspect="auto", 
+                        title="Performance Metrics Correlation Analysis",
+                        color_continuous_scale='RdBu_r',
+                        zmin=-1, zmax=1,
+                        labels=dict(x="Performance Metrics", y="Performance Metrics", color="Correlation"))
+    fig_corr.update_layout(height=450,
+                           xaxis_title="Performance Metrics",
+                           yaxis_title="Performance Metrics")
+    return fig_corr
+
+fig_corr = cached_figure('fig_corr', build_fig_corr)
 plotly(fig_corr)
 
 # DISPLAY EXAMPLES OF FAST RESPONSE INCIDENTS
-if speedy_calls is not None and len(speedy_calls) > 0:
-    fast_examples = speedy_calls.head(12)[['borough', 'final_call_type', 'dispatch_response_seconds_qy']].copy()
+if len(speedy_calls) > 0:
+    fast_examples = speedy_calls.reset_index(drop=True)
     fast_examples['response_min'] = (fast_examples['dispatch_response_seconds_qy'] / 60).round(1)
     table(fast_examples)
 
-# SHOW BOROUGH CALL VOLUMES FROM SQL QUERY
-if borough_volumes is not None and len(borough_volumes) > 0:
+# SHOW BOROUGH CALL VOLUMES ABOVE THE MINIMUM THRESHOLD
+if len(borough_volumes) > 0:
     table(borough_volumes)
 
 # TIME TREND ANALYSIS IF DATE INFORMATION AVAILABLE
-date_columns = [col for col in clean_dataset.columns if 'date' in col.lower() or 'time' in col.lower()]
 if date_columns:
     date_col = date_columns[0]
-    trend_data = clean_dataset.copy()
-    trend_data[date_col] = pd.to_datetime(trend_data[date_col], errors='coerce')
     
-    if not trend_data[date_col].isna().all():
-        daily_trends = (trend_data.groupby(trend_data[date_col].dt.date)
-                       .agg({'dispatch_response_seconds_qy': 'mean'})
-                       .reset_index())
-        daily_trends.columns = ['date', 'avg_response_sec']
+    # CHECK A SMALL SAMPLE FIRST AND ONLY SCAN THE WHOLE COLUMN WHEN THE SAMPLE HAS NO PARSED DATES
+    if clean_dataset[date_col].iloc[:1000].notna().any() or clean_dataset[date_col].notna().any():
+        def build_fig_trend():
+            daily_trends = (clean_dataset['dispatch_response_seconds_qy']
+                           .groupby(clean_dataset[date_col].dt.floor('D'))
+                           .mean()
+                           .reset_index())
+            daily_trends.columns = ['date', 'avg_response_sec']
         
-        fig_trend = px.line(daily_trends,
-                           x='date', 
-                           y='avg_response_sec',
-                           title='Daily Response Time Trends',
-                           labels={'avg_response_sec': 'Average Response Time (Seconds)', 'date': 'Date'})
-        fig_trend.add_hline(y=480, line_dash="dash", line_color="#d62728", line_width=2)
-        fig_trend.update_layout(height=400,
-                                xaxis_title="Date",
-                                yaxis_title="Average Response Time (Seconds)")
+            fig_trend = px.line(daily_trends,
+                               x='date', 
+                               y='avg_response_sec',
+                               title='Daily Response Time Trends',
+                               labels={'avg_response_sec': 'Average Response Time (Seconds)', 'date': 'Date'})
+            fig_trend.add_hline(y=480, line_dash="dash", line_color="#d62728", line_width=2)
+            fig_trend.update_layout(height=400,
+                                    xaxis_title="Date",
+                                    yaxis_title="Average Response Time (Seconds)")
+            return fig_trend
+
+        fig_trend = cached_figure('fig_trend', build_fig_trend)
         plotly(fig_trend)
\ No newline at end of file